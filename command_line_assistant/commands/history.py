@@ -1,8 +1,11 @@
 """Module to handle the history command."""
 
 from argparse import Namespace
+from functools import cached_property
 from typing import Optional
 
+from dasbus.client.proxy import ObjectProxy
+
 from command_line_assistant.dbus.constants import HISTORY_IDENTIFIER
 from command_line_assistant.dbus.exceptions import (
     CorruptedHistoryError,
@@ -27,7 +30,11 @@ class HistoryCommand(BaseCLICommand):
     """Class that represents the history command."""
 
     def __init__(
-        self, clear: bool, first: bool, last: bool, filter: Optional[str] = None
+        self,
+        clear: bool,
+        first: bool,
+        last: bool,
+        filter_keyword: Optional[str] = None,
     ) -> None:
         """Constructor of the class.
 
@@ -39,29 +46,84 @@ class HistoryCommand(BaseCLICommand):
             clear (bool): If the history should be cleared
             first (bool): Retrieve only the first conversation from history
             last (bool): Retrieve only last conversation from history
-            filter (Optional[str], optional): Keyword to filter in the user history
+            filter_keyword (Optional[str], optional): Keyword to filter in the user history
         """
         self._clear = clear
         self._first = first
         self._last = last
-        self._filter = filter
+        self._filter_keyword = filter_keyword
+
+        super().__init__()
 
-        self._proxy = HISTORY_IDENTIFIER.get_proxy()
+    @cached_property
+    def _spinner_renderer(self) -> SpinnerRenderer:
+        """Lazily create the spinner shown while loading the history.
 
-        self._spinner_renderer: SpinnerRenderer = create_spinner_renderer(
+        Returns:
+            SpinnerRenderer: Instance of the spinner renderer.
+        """
+        return create_spinner_renderer(
             message="Loading history",
             decorators=[EmojiDecorator(emoji="U+1F916")],
         )
-        self._q_renderer: TextRenderer = create_text_renderer(
-            decorators=[ColorDecorator("lightgreen")]
-        )
-        self._a_renderer: TextRenderer = create_text_renderer(
-            decorators=[ColorDecorator("lightblue")]
-        )
-        self._text_renderer: TextRenderer = create_text_renderer()
-        self._error_renderer: TextRenderer = create_error_renderer()
 
-        super().__init__()
+    @cached_property
+    def _q_renderer(self) -> TextRenderer:
+        """Lazily create the renderer for the queries.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return create_text_renderer(decorators=[ColorDecorator("lightgreen")])
+
+    @cached_property
+    def _a_renderer(self) -> TextRenderer:
+        """Lazily create the renderer for the answers.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return create_text_renderer(decorators=[ColorDecorator("lightblue")])
+
+    @cached_property
+    def _text_renderer(self) -> TextRenderer:
+        """Lazily create the renderer for plain messages.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return create_text_renderer()
+
+    @cached_property
+    def _history_renderer(self) -> TextRenderer:
+        """Lazily create the renderer that writes the decorated history.
+
+        Note:
+            This renderer has no decorators, as the history entries are
+            decorated by the other renderers before being written together.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return TextRenderer()
+
+    @cached_property
+    def _error_renderer(self) -> TextRenderer:
+        """Lazily create the renderer for error messages.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return create_error_renderer()
+
+    @cached_property
+    def _proxy(self) -> ObjectProxy:
+        """Lazily create the proxy to the history D-Bus service.
+
+        Returns:
+            ObjectProxy: The proxy used to issue the D-Bus calls.
+        """
+        return HISTORY_IDENTIFIER.get_proxy()
 
     def run(self) -> int:
         """Main entrypoint for the command to run.
@@ -77,8 +139,12 @@ class HistoryCommand(BaseCLICommand):
                 self._retrieve_first_conversation()
             elif self._last:
                 self._retrieve_last_conversation()
-            elif self._filter:
-                self._retrieve_conversation_filtered(self._filter)
+            elif self._filter_keyword is not None:
+                # Don't bother the daemon with a filter that matches nothing.
+                if not self._filter_keyword.strip():
+                    self._error_renderer.render("The filter keyword can't be empty.")
+                    return 1
+                self._retrieve_conversation_filtered(self._filter_keyword)
             else:
                 self._retrieve_all_conversations()
 
@@ -105,15 +171,15 @@ class HistoryCommand(BaseCLICommand):
         # Display the conversation
         self._show_history(history.entries)
 
-    def _retrieve_conversation_filtered(self, filter: str) -> None:
+    def _retrieve_conversation_filtered(self, filter_keyword: str) -> None:
         """Retrieve the user conversation with keyword filtering.
 
         Args:
-            filter (str): Keyword to filter in the user history
+            filter_keyword (str): Keyword to filter in the user history
         """
         self._text_renderer.render("Filtering conversation history.")
         response = self._proxy.GetFilteredConversation(
-            self._context.effective_user_id, filter
+            self._context.effective_user_id, filter_keyword
         )
 
         # Handle and display the response
@@ -149,16 +215,28 @@ class HistoryCommand(BaseCLICommand):
             return
 
         is_separator_needed = len(entries) > 1
+        # Timestamps share the same length, so the decorated separator is
+        # built once per length instead of once per entry.
+        separators: dict[int, str] = {}
+        blocks = []
         for entry in entries:
-            self._q_renderer.render(f"Query: {entry.query}")
-            self._a_renderer.render(f"Answer: {entry.response}")
+            blocks.append(self._q_renderer.format(f"Query: {entry.query}"))
+            blocks.append(self._a_renderer.format(f"Answer: {entry.response}"))
 
             timestamp = f"Time: {entry.timestamp}"
-            self._text_renderer.render(timestamp)
+            blocks.append(self._text_renderer.format(timestamp))
 
             if is_separator_needed:
                 # Separator between conversations
-                self._text_renderer.render("-" * len(timestamp))
+                length = len(timestamp)
+                separator = separators.get(length)
+                if separator is None:
+                    separator = self._text_renderer.format("-" * length)
+                    separators[length] = separator
+                blocks.append(separator)
+
+        # Every block is already decorated, write them all at once.
+        self._history_renderer.render("\n".join(blocks))
 
 
 def register_subcommand(parser: SubParsersAction):
@@ -172,23 +250,28 @@ def register_subcommand(parser: SubParsersAction):
         "history",
         help="Manage user conversation history",
     )
-    history_parser.add_argument(
+    # Only one action can be performed at a time, let argparse reject any
+    # combination instead of silently picking one of them.
+    history_actions = history_parser.add_mutually_exclusive_group()
+    history_actions.add_argument(
         "--clear",
         action="store_true",
         help="Clear the entire history.",
     )
-    history_parser.add_argument(
+    history_actions.add_argument(
         "--first",
         action="store_true",
         help="Get the first conversation from history.",
     )
-    history_parser.add_argument(
+    history_actions.add_argument(
         "--last",
         action="store_true",
         help="Get the last conversation from history.",
     )
-    history_parser.add_argument(
-        "--filter", help="Search for a specific keyword of text in the history."
+    history_actions.add_argument(
+        "--filter",
+        dest="filter_keyword",
+        help="Search for a specific keyword of text in the history.",
     )
     history_parser.set_defaults(func=_command_factory)
 
@@ -202,4 +285,4 @@ def _command_factory(args: Namespace) -> HistoryCommand:
     Returns:
         HistoryCommand: Return an instance of class
     """
-    return HistoryCommand(args.clear, args.first, args.last, args.filter)
+    return HistoryCommand(args.clear, args.first, args.last, args.filter_keyword)
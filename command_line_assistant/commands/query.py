@@ -2,8 +2,11 @@
 
 import argparse
 from argparse import Namespace
+from functools import cached_property
 from io import TextIOWrapper
-from typing import Optional
+from typing import Callable, Optional
+
+from dasbus.client.proxy import ObjectProxy
 
 from command_line_assistant.dbus.constants import QUERY_IDENTIFIER
 from command_line_assistant.dbus.exceptions import (
@@ -37,6 +40,31 @@ LEGAL_NOTICE = (
 #: Always good to have legal message.
 ALWAYS_LEGAL_MESSAGE = "Always review AI generated content prior to use."
 
+#: Bit flags representing each input source provided by the user.
+QUERY_SOURCE = 0b100
+STDIN_SOURCE = 0b010
+ATTACHMENT_SOURCE = 0b001
+
+#: Map the combination of input sources to how the final question is built.
+#: The callables receive the query, stdin and attachment contents in order.
+#: Single sources are not mapped here as they are used as-is.
+INPUT_SOURCE_TABLE: dict[int, Callable[[str, str, str], str]] = {
+    # Rule 7: All three present - positional and file take precedence
+    QUERY_SOURCE | STDIN_SOURCE | ATTACHMENT_SOURCE: lambda query, stdin, attachment: (
+        f"{query} {attachment}"
+    ),
+    # Rule 6: Positional + file
+    QUERY_SOURCE | ATTACHMENT_SOURCE: lambda query, stdin, attachment: (
+        f"{query} {attachment}"
+    ),
+    # Rule 5: Stdin + file
+    STDIN_SOURCE | ATTACHMENT_SOURCE: lambda query, stdin, attachment: (
+        f"{stdin} {attachment}"
+    ),
+    # Rule 4: Stdin + positional
+    QUERY_SOURCE | STDIN_SOURCE: lambda query, stdin, attachment: f"{query} {stdin}",
+}
+
 
 class QueryCommand(BaseCLICommand):
     """Class that represents the query command."""
@@ -58,28 +86,100 @@ class QueryCommand(BaseCLICommand):
         self._stdin = stdin.strip() if stdin else None
         self._attachment = attachment
 
-        self._spinner_renderer: SpinnerRenderer = create_spinner_renderer(
+        super().__init__()
+
+    @cached_property
+    def _error_renderer(self) -> TextRenderer:
+        """Lazily create the renderer for error messages.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return create_error_renderer()
+
+    @cached_property
+    def _warning_renderer(self) -> TextRenderer:
+        """Lazily create the renderer for warning messages.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return create_warning_renderer()
+
+    @cached_property
+    def _spinner_renderer(self) -> SpinnerRenderer:
+        """Lazily create the spinner shown while waiting for the answer.
+
+        Returns:
+            SpinnerRenderer: Instance of the spinner renderer.
+        """
+        return create_spinner_renderer(
             message="Requesting knowledge from AI",
             decorators=[EmojiDecorator(emoji="U+1F916")],
         )
-        self._text_renderer: TextRenderer = create_text_renderer(
-            decorators=[ColorDecorator(foreground="green")]
-        )
-        self._legal_renderer: TextRenderer = create_text_renderer(
+
+    @cached_property
+    def _text_renderer(self) -> TextRenderer:
+        """Lazily create the renderer for the answer.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return create_text_renderer(decorators=[ColorDecorator(foreground="green")])
+
+    @cached_property
+    def _legal_renderer(self) -> TextRenderer:
+        """Lazily create the renderer for the legal notice.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return create_text_renderer(
             decorators=[
                 ColorDecorator(foreground="lightyellow"),
                 WriteOnceDecorator(state_filename="legal"),
             ]
         )
-        self._notice_renderer: TextRenderer = create_text_renderer(
+
+    @cached_property
+    def _notice_renderer(self) -> TextRenderer:
+        """Lazily create the renderer for the notice after the answer.
+
+        Returns:
+            TextRenderer: Instance of the text renderer.
+        """
+        return create_text_renderer(
             decorators=[ColorDecorator(foreground="lightyellow")]
         )
-        self._error_renderer: TextRenderer = create_error_renderer()
-        self._warning_renderer: TextRenderer = create_warning_renderer()
 
-        self._proxy = QUERY_IDENTIFIER.get_proxy()
+    @cached_property
+    def _proxy(self) -> ObjectProxy:
+        """Lazily create the proxy to the query D-Bus service.
 
-        super().__init__()
+        Returns:
+            ObjectProxy: The proxy used to issue the D-Bus calls.
+        """
+        return QUERY_IDENTIFIER.get_proxy()
+
+    @cached_property
+    def _attachment_content(self) -> Optional[str]:
+        """Read and parse the attachment file only once.
+
+        Raises:
+            ValueError: If the attachment is in binary format
+
+        Returns:
+            Optional[str]: The stripped contents of the attachment, or None if
+            no attachment was provided.
+        """
+        if not self._attachment:
+            return None
+
+        file_content = self._attachment.read().strip()
+        if is_content_in_binary_format(file_content):
+            raise ValueError("File appears to be binary")
+
+        return file_content
 
     def _get_input_source(self) -> str:
         """Determine and return the appropriate input source based on combination rules.
@@ -99,44 +199,33 @@ class QueryCommand(BaseCLICommand):
         Returns:
             str: The query string from the selected input source(s)
         """
-        file_content = None
-        if self._attachment:
-            file_content = self._attachment.read().strip()
-            if is_content_in_binary_format(file_content):
-                raise ValueError("File appears to be binary")
+        file_content = self._attachment_content
 
-            file_content = file_content.strip()
+        sources = (
+            (QUERY_SOURCE if self._query else 0)
+            | (STDIN_SOURCE if self._stdin else 0)
+            | (ATTACHMENT_SOURCE if file_content else 0)
+        )
 
-        # Rule 7: All three present - positional and file take precedence
-        if all([self._query, self._stdin, file_content]):
+        if sources == QUERY_SOURCE | STDIN_SOURCE | ATTACHMENT_SOURCE:
             self._warning_renderer.render(
                 "Using positional query and file input. Stdin will be ignored."
             )
-            return f"{self._query} {file_content}"
-
-        # Rule 6: Positional + file
-        if self._query and file_content:
-            return f"{self._query} {file_content}"
-
-        # Rule 5: Stdin + file
-        if self._stdin and file_content:
-            return f"{self._stdin} {file_content}"
 
-        # Rule 4: Stdin + positional
-        if self._stdin and self._query:
-            return f"{self._query} {self._stdin}"
+        build_question = INPUT_SOURCE_TABLE.get(sources)
+        if build_question:
+            return build_question(
+                self._query or "", self._stdin or "", file_content or ""
+            )
 
         # Rules 1-3: Single source - return first non-empty source
-        source = next(
-            (src for src in [self._query, self._stdin, file_content] if src),
-            None,
-        )
-        if source:
-            return source
+        source = self._query or self._stdin or file_content
+        if not source:
+            raise ValueError(
+                "No input provided. Please provide input via file, stdin, or direct query."
+            )
 
-        raise ValueError(
-            "No input provided. Please provide input via file, stdin, or direct query."
-        )
+        return source
 
     def run(self) -> int:
         """Main entrypoint for the command to run.
@@ -208,14 +297,5 @@ def _command_factory(args: Namespace) -> QueryCommand:
     Returns:
         QueryCommand: Return an instance of class
     """
-    options = {
-        "query_string": args.query_string,
-        "stdin": None,
-        "attachment": args.attachment,
-    }
-
-    # We may not always have the stdin argument in the namespace.
-    if "stdin" in args:
-        options["stdin"] = args.stdin
-
-    return QueryCommand(**options)
+    # The stdin is always present in the namespace, see `initialize()`.
+    return QueryCommand(args.query_string, args.stdin, args.attachment)
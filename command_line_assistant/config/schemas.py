@@ -1,12 +1,29 @@
 """Module to hold the config schema and it's sub schemas."""
 
-import copy
 import dataclasses
-import pwd
 from pathlib import Path
 from typing import Optional, Union
 
 
+def _expand_path(path: Union[str, Path]) -> Path:
+    """Expand the user home in a path, if needed.
+
+    Note:
+        Absolute paths can't contain a `~`, so they are returned as they are.
+        All the defaults in this module are absolute paths.
+
+    Args:
+        path (Union[str, Path]): The path to expand
+
+    Returns:
+        Path: The expanded path
+    """
+    if isinstance(path, Path) and path.is_absolute():
+        return path
+
+    return Path(path).expanduser()
+
+
 @dataclasses.dataclass
 class DatabaseSchema:
     """This class represents the [history.database] section of our config.toml file.
@@ -43,7 +60,7 @@ class DatabaseSchema:
             )
 
         if self.connection_string:
-            self.connection_string = Path(self.connection_string).expanduser()
+            self.connection_string = _expand_path(self.connection_string)
 
         # Post-initialization to set default values for specific db types
         if self.type == "sqlite" and not self.connection_string:
@@ -63,16 +80,13 @@ class DatabaseSchema:
         Returns:
             str: The URL formatted connection
         """
-        connection_urls = {
-            "sqlite": f"sqlite:///{self.connection_string}",
-            "mysql": f"mysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}",
-            "postgresql": f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}",
-        }
+        if self.type == "sqlite":
+            return f"sqlite:///{self.connection_string}"
 
-        if self.type not in connection_urls:
-            raise ValueError(f"Unsupported database type: {self.type}")
+        if self.type in ("mysql", "postgresql"):
+            return f"{self.type}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
-        return connection_urls[self.type]
+        raise ValueError(f"Unsupported database type: {self.type}")
 
 
 @dataclasses.dataclass
@@ -107,16 +121,21 @@ class LoggingSchema:
         self.level = self.level.upper()
 
         if self.users:
+            # pwd is only needed to resolve per-user settings, so we import it
+            # here instead of at module level.
+            import pwd
+
             # Turn any username to their effective_user_id
-            defined_users = copy.deepcopy(self.users)
-            for user in defined_users.keys():
+            users = {}
+            for user, settings in self.users.items():
                 try:
                     effective_user_id = str(pwd.getpwnam(user).pw_uid)
-                    self.users[effective_user_id] = self.users.pop(user)
                 except KeyError as e:
                     raise ValueError(
                         f"{user} is not present on the system. Remove it from the configuration."
                     ) from e
+                users[effective_user_id] = settings
+            self.users = users
 
 
 @dataclasses.dataclass
@@ -135,7 +154,7 @@ class OutputSchema:
 
     def __post_init__(self):
         """Post initialization method to normalize values"""
-        self.file: Path = Path(self.file).expanduser()
+        self.file: Path = _expand_path(self.file)
 
 
 @dataclasses.dataclass
@@ -175,8 +194,8 @@ class AuthSchema:
 
     def __post_init__(self) -> None:
         """Post initialization method to normalize values"""
-        self.cert_file = Path(self.cert_file).expanduser()
-        self.key_file = Path(self.key_file).expanduser()
+        self.cert_file = _expand_path(self.cert_file)
+        self.key_file = _expand_path(self.key_file)
 
 
 @dataclasses.dataclass
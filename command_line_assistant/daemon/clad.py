@@ -3,19 +3,23 @@
 import logging
 import sys
 
-from command_line_assistant.config import load_config_file
-from command_line_assistant.dbus.server import serve
-from command_line_assistant.logger import setup_logging
-
 logger = logging.getLogger(__name__)
 
 
 def daemonize() -> int:
     """Main start point for the clad binary.
 
+    Note:
+        The daemon dependencies (dasbus, sqlalchemy, requests) are imported
+        here instead of at module level, so importing this module stays cheap.
+
     Returns:
         int: The status code.
     """
+    from command_line_assistant.config import load_config_file
+    from command_line_assistant.dbus.server import serve
+    from command_line_assistant.logger import setup_logging
+
     # Load up the configuration file
     config = load_config_file()
     setup_logging(config)
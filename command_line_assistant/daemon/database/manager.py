@@ -85,9 +85,18 @@ class DatabaseManager:
             raise ConnectionError(f"Could not create database engine: {e}") from e
 
     def connect(self) -> None:
-        """Create database tables if they don't exist."""
+        """Create database tables and indexes if they don't exist.
+
+        Note:
+            `create_all` skips tables that already exist, including their
+            indexes, so indexes added to an existing table are created
+            separately.
+        """
         try:
             BaseModel.metadata.create_all(self._engine)
+            for table in BaseModel.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(self._engine, checkfirst=True)
         except Exception as e:
             logger.error("Failed to create database tables: %s", e)
             raise ConnectionError(f"Could not create tables: {e}") from e
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from command_line_assistant.daemon.database.models.base import GUID, BaseModel
@@ -13,6 +13,11 @@ class HistoryModel(BaseModel):
     """SQLAlchemy model for history table that maps to HistoryEntry dataclass."""
 
     __tablename__ = "history"
+    __table_args__ = (
+        # Covers the per-user history lookup, which is filtered by user_id and
+        # sorted by timestamp.
+        Index("ix_history_user_id_timestamp", "user_id", "timestamp"),
+    )
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     user_id = Column(GUID(), nullable=False)
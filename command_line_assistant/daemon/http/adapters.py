@@ -7,6 +7,16 @@ from typing import Union
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
+#: The default retry policy for the backend requests. Retry instances are not
+#: mutated by urllib3 (every increment returns a new one), so this can be
+#: shared by all the adapters.
+DEFAULT_RETRY: Retry = Retry(
+    total=3,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+)
+
 
 class SSLAdapter(HTTPAdapter):
     """Create an adapter to use a custom SSL context in requests.
@@ -56,10 +66,9 @@ class RetryAdapter(HTTPAdapter):
             max_retries (Union[Retry, int, None], optional): The maximum number of retires. Defaults to 3.
             pool_block (bool, optional): If the pool should be blocked. Defaults to False.
         """
-        retries = Retry(
-            total=max_retries,
-            backoff_factor=0.1,
-            status_forcelist=[502, 503, 504],
-            allowed_methods={"POST"},
+        retries = (
+            DEFAULT_RETRY
+            if max_retries == DEFAULT_RETRY.total
+            else DEFAULT_RETRY.new(total=max_retries)
         )
         super().__init__(pool_connections, pool_maxsize, retries, pool_block)
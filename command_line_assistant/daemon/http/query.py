@@ -1,12 +1,11 @@
 """Module to handle the query submission to the backend."""
 
-import json
 import logging
 
 from requests import RequestException
 
 from command_line_assistant.config import Config
-from command_line_assistant.daemon.http.session import get_session
+from command_line_assistant.daemon.http.session import get_pooled_session
 from command_line_assistant.dbus.exceptions import RequestFailedError
 
 logger = logging.getLogger(__name__)
@@ -32,10 +31,8 @@ def submit(query: str, config: Config) -> str:
         logger.info("Waiting for response from AI...")
         logger.debug("User query: %s", query)
 
-        with get_session(config) as session:
-            response = session.post(
-                query_endpoint, data=json.dumps(payload), timeout=30
-            )
+        session = get_pooled_session(config)
+        response = session.post(query_endpoint, json=payload, timeout=30)
 
         response.raise_for_status()
         data = response.json()
@@ -2,6 +2,7 @@
 
 import logging
 from ssl import SSLError
+from typing import Optional
 
 import urllib3
 from requests.sessions import Session
@@ -14,6 +15,9 @@ from command_line_assistant.dbus.exceptions import RequestFailedError
 #: Define the custom user agent for clad
 USER_AGENT = f"clad/{VERSION}"
 
+#: The session shared between requests, along with the config it was built for
+_pooled_session: Optional[tuple[Config, Session]] = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,3 +70,30 @@ def get_session(config: Config) -> Session:
     session.mount(config.backend.endpoint, ssl_adapter)
 
     return session
+
+
+def get_pooled_session(config: Config) -> Session:
+    """Retrieve a session that is reused between requests.
+
+    Reusing the same session keeps its connection pool alive, so consecutive
+    requests to the backend don't pay for a new TCP and TLS handshake every
+    time.
+
+    Note:
+        The session is rebuilt whenever a different config instance is
+        given, so it always matches the current endpoint and auth settings.
+
+    Args:
+        config (Config): Instance of the config class
+
+    Returns:
+        Session: A mounted session with the necessary adapters.
+    """
+    global _pooled_session
+
+    if _pooled_session is None or _pooled_session[0] is not config:
+        if _pooled_session is not None:
+            _pooled_session[1].close()
+        _pooled_session = (config, get_session(config))
+
+    return _pooled_session[1]
@@ -1,5 +1,6 @@
 """Session management module for the daemon."""
 
+import functools
 import logging
 import uuid
 from pathlib import Path
@@ -11,6 +12,41 @@ MACHINE_ID_PATH: Path = Path("/etc/machine-id")
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _read_machine_id(machine_id_path: Path) -> uuid.UUID:
+    """Read and parse the machine-id file.
+
+    Note:
+        The machine-id doesn't change while the daemon is running, so the
+        result is cached per process to avoid reading the file on every
+        D-Bus call.
+
+    Args:
+        machine_id_path (Path): The path to the machine-id file
+
+    Raises:
+        FileNotFoundError: If the machine-id file doesn't exist
+        ValueError: If the machine-id file is empty or malformed
+
+    Returns:
+        uuid.UUID: The UUID generated from machine-id
+    """
+    try:
+        machine_id = machine_id_path.read_text().strip()
+    except FileNotFoundError as e:
+        logger.error("Machine ID file not found at %s", machine_id_path)
+        raise FileNotFoundError(
+            f"Machine ID file not found at {machine_id_path}"
+        ) from e
+
+    if not machine_id:
+        logger.error("Machine ID file is empty")
+        raise ValueError(f"Machine ID at {machine_id_path} is empty")
+
+    # Create a UUID from the machine-id string
+    return uuid.UUID(machine_id)
+
+
 class UserSessionManager:
     """Manage user session information."""
 
@@ -39,18 +75,7 @@ class UserSessionManager:
             uuid.UUID: The UUID generated from machine-id
         """
         if not self._machine_uuid:
-            try:
-                machine_id = MACHINE_ID_PATH.read_text().strip()
-                if not machine_id:
-                    logger.error("Machine ID file is empty")
-                    raise ValueError(f"Machine ID at {MACHINE_ID_PATH} is empty")
-                # Create a UUID from the machine-id string
-                self._machine_uuid = uuid.UUID(machine_id)
-            except FileNotFoundError as e:
-                logger.error("Machine ID file not found at %s", MACHINE_ID_PATH)
-                raise FileNotFoundError(
-                    f"Machine ID file not found at {MACHINE_ID_PATH}"
-                ) from e
+            self._machine_uuid = _read_machine_id(MACHINE_ID_PATH)
 
         return self._machine_uuid
 
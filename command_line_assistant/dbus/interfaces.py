@@ -111,11 +111,13 @@ class HistoryInterface(InterfaceTemplate):
 
         return HistoryEntry.to_structure(history_entry)
 
-    def GetFilteredConversation(self, effective_user_id: Int, filter: Str) -> Structure:
+    def GetFilteredConversation(
+        self, effective_user_id: Int, filter_keyword: Str
+    ) -> Structure:
         """Get last conversation from history.
 
         Args:
-            filter (str): The filter
+            filter_keyword (str): The keyword to look for in the history
 
         Returns:
             Structure: A single history entyr in a dbus structure format.
@@ -127,12 +129,15 @@ class HistoryInterface(InterfaceTemplate):
         history_entry = HistoryEntry()
 
         if history_entries:
-            logger.info("Filtering the user history with keyword '%s'", filter)
+            logger.info("Filtering the user history with keyword '%s'", filter_keyword)
             # Filter entries where the query or response contains the filter string
             filtered_entries = [
                 entry
                 for entry in history_entries
-                if (filter in entry["query"] or filter in entry["response"])
+                if (
+                    filter_keyword in entry["query"]
+                    or filter_keyword in entry["response"]
+                )
             ]
 
             history_entry = _parse_history_entries(filtered_entries)
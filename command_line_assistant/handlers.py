@@ -22,9 +22,12 @@ def handle_script_session(command_line_assistant_tmp_file: Path) -> None:
     os.system(" ".join(script_command))
 
     # Remove the captured output after the script session ends
-    if os.path.exists(command_line_assistant_tmp_file):
-        logger.info("Removing %s", command_line_assistant_tmp_file)
-        os.remove(command_line_assistant_tmp_file)
+    try:
+        command_line_assistant_tmp_file.unlink()
+    except FileNotFoundError:
+        return
+
+    logger.info("Removed %s", command_line_assistant_tmp_file)
 
 
 def handle_caret(query: str, config: Config) -> str:
@@ -44,18 +47,21 @@ def handle_caret(query: str, config: Config) -> str:
         return query
 
     captured_output_file = config.output.file
+    prompt_separator = config.output.prompt_separator
 
-    if not os.path.exists(captured_output_file):
+    # Open the file straight away instead of checking for it first, a missing
+    # file is reported by open() itself without an extra stat() call.
+    try:
+        with open(captured_output_file, encoding="utf-8", mode="r") as f:
+            # NOTE: takes only last command + output from file. rpartition scans
+            # from the end and avoids splitting the whole captured output.
+            output = f.read().rpartition(prompt_separator)[-1].strip()
+    except FileNotFoundError as e:
         logger.error(
             "Output file %s does not exist, change location of file in config to use '^'.",
             captured_output_file,
         )
-        raise ValueError(f"Output file {captured_output_file} does not exist.")
-
-    prompt_separator = config.output.prompt_separator
-    with open(captured_output_file, encoding="utf-8", mode="r") as f:
-        # NOTE: takes only last command + output from file
-        output = f.read().split(prompt_separator)[-1].strip()
+        raise ValueError(f"Output file {captured_output_file} does not exist.") from e
 
     query = query.replace("^", "")
     query = f"Context data: {output}\nQuestion: " + query
@@ -6,6 +6,7 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import asc
+from sqlalchemy.orm import contains_eager
 
 from command_line_assistant.config import Config
 from command_line_assistant.daemon.database.manager import DatabaseManager
@@ -66,14 +67,17 @@ class LocalHistory(BaseHistoryPlugin):
 
         try:
             with self._db.session() as session:
-                # Query history entries with relationships
+                # Load the interactions from the same join and stream the rows
+                # in batches, instead of materializing every entry up front and
+                # lazy loading each interaction with its own query.
                 entries = (
                     session.query(HistoryModel)
                     .join(InteractionModel)
+                    .options(contains_eager(HistoryModel.interaction))
+                    .where(HistoryModel.user_id == user_id)
                     .filter(HistoryModel.deleted_at.is_(None))
                     .order_by(asc(HistoryModel.timestamp))
-                    .where(HistoryModel.user_id == user_id)
-                    .all()
+                    .yield_per(256)
                 )
 
                 return [
@@ -1,30 +1,45 @@
 """Main module for the cli."""
 
+import importlib
 import sys
 from argparse import ArgumentParser, Namespace
+from typing import Optional
 
-from command_line_assistant.commands import history, query
 from command_line_assistant.utils.cli import (
+    SUBCOMMANDS,
     add_default_command,
     create_argument_parser,
     read_stdin,
+    subcommand_used,
 )
-from command_line_assistant.utils.renderers import create_error_renderer
 
 
-def register_subcommands() -> ArgumentParser:
+def register_subcommands(subcommand: Optional[str] = None) -> ArgumentParser:
     """Register all the subcommands for the CLI
 
+    Note:
+        When a `subcommand` is selected, only its module is imported and only
+        its parser is registered, as argparse will never look at the other
+        ones. Otherwise, every subcommand module is imported and registered,
+        so the parser describes the whole CLI (as the man page needs).
+
+    Args:
+        subcommand (Optional[str], optional): The subcommand selected by the
+        user. Defaults to None.
+
     Returns:
-        ArgumentParser: The parser with all the subcommands registered.
+        ArgumentParser: The parser with the subcommands registered.
     """
     parser, commands_parser = create_argument_parser()
 
-    # TODO: add autodetection of BaseCLICommand classes in the future so we can
-    # just drop new subcommand python modules into the directory and then loop
-    # and call `register_subcommand()` on each one.
-    query.register_subcommand(commands_parser)  # type: ignore
-    history.register_subcommand(commands_parser)  # type: ignore
+    if subcommand in SUBCOMMANDS:
+        module_names = [SUBCOMMANDS[subcommand]]
+    else:
+        module_names = list(SUBCOMMANDS.values())
+
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        module.register_subcommand(commands_parser)  # type: ignore
 
     return parser
 
@@ -35,13 +50,15 @@ def initialize() -> int:
     Returns:
         int: Status code of the execution
     """
-    parser = register_subcommands()
-
     stdin = None
     try:
         stdin = read_stdin()
     except UnicodeDecodeError:
         # Usually happens when the user try to cat a binary file and redirect that to us.
+        # The rendering stack is only imported here, as every subcommand
+        # already brings its own renderers.
+        from command_line_assistant.utils.renderers import create_error_renderer
+
         error_renderer = create_error_renderer()
         error_renderer.render(
             "The stdin provided could not be decoded. Please, make sure it is in textual format."
@@ -49,10 +66,12 @@ def initialize() -> int:
         return 1
 
     args = add_default_command(stdin, sys.argv)
+    parser = register_subcommands(subcommand_used(args))
 
-    # Small workaround to include the stdin in the namespace object in case it exists.
-    namespace = Namespace(stdin=stdin) if stdin else Namespace()
-    args = parser.parse_args(args, namespace=namespace)
+    # Small workaround to include the stdin in the namespace object. It is
+    # always set (even if it is None), so command factories can read it as a
+    # plain attribute.
+    args = parser.parse_args(args, namespace=Namespace(stdin=stdin))
 
     if not hasattr(args, "func"):
         parser.print_help()
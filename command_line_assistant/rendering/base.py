@@ -48,6 +48,15 @@ class BaseStream:
 
         self._stream.flush()
 
+    def isatty(self) -> bool:
+        """Check if the output stream is connected to a terminal
+
+        Returns:
+            bool: True if the stream is a terminal, False otherwise.
+        """
+
+        return self._stream.isatty()
+
     def execute(self, text: str) -> None:
         """
         Write the text to the output stream and flush it immediately.
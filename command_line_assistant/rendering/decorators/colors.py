@@ -29,6 +29,8 @@ class ColorDecorator(BaseDecorator):
     Attributes:
         FOREGROUND_COLORS (dict[str, str]): The foreground color to be applied to the text. They contain normal and light variants.
         BACKGROUND_COLORS (dict[str, str]): The background color to be applied to the text. They contain normal and light variants.
+        prefix (str): The escape sequence written before the text. Empty if color output is disabled.
+        suffix (str): The escape sequence written after the text. Empty if color output is disabled.
     """
 
     FOREGROUND_COLORS = {
@@ -87,6 +89,15 @@ class ColorDecorator(BaseDecorator):
         self.foreground = self._get_foreground_color(foreground)
         self.background = self._get_background_color(background) if background else ""
 
+        # The escape sequences wrapping the text never change for an instance,
+        # so resolve them (and the NO_COLOR check) once instead of per line.
+        if should_disable_color_output():
+            self.prefix = ""
+            self.suffix = ""
+        else:
+            self.prefix = f"{self.background}{self.foreground}"
+            self.suffix = RESET_ALL
+
     def _get_foreground_color(self, color: str) -> str:
         """Get the unicode for the requested color.
 
@@ -134,10 +145,7 @@ class ColorDecorator(BaseDecorator):
         Returns:
             str: The text itself colored with the requested foreground and (optionally) background color.
         """
-        if not should_disable_color_output():
-            formatted_text = f"{self.background}{self.foreground}{text}{RESET_ALL}"
-            return formatted_text
-        return text
+        return f"{self.prefix}{text}{self.suffix}"
 
 
 def should_disable_color_output() -> bool:
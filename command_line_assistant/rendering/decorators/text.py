@@ -141,15 +141,21 @@ class WriteOnceDecorator(BaseDecorator):
         Returns:
             bool: In Return a boolean value if the state file can be written.
         """
+        # Most runs end here, as the state file was created by a previous one.
         if self._state_file.exists():
             return False
 
-        if not self._state_dir.exists():
-            # Create directory if it doesn't exist
-            self._state_dir.mkdir(parents=True)
+        # Create directory if it doesn't exist
+        self._state_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            # Exclusive creation, in case another process created the file
+            # since the check above.
+            with self._state_file.open(mode="x") as handler:
+                handler.write("1")
+        except FileExistsError:
+            return False
 
-        # Write state file
-        self._state_file.write_text("1")
         return True
 
     def decorate(self, text: str) -> str:
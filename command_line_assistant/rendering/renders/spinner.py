@@ -118,10 +118,19 @@ class SpinnerRenderer(BaseRenderer):
         This applies the decorators of a text on each frame to keep
         consistency. It uses a thread to validate if we should still output
         text to the screen or not.
+
+        Note:
+            Only the frame changes between iterations, so the decorated message
+            is cached per frame and the decorators run once per distinct frame.
         """
+        decorated_frames: dict[str, str] = {}
         while not self._done.is_set():
             frame = next(self._frames)
-            message = self._apply_decorators(f"{frame} {self._message}")
+            message = decorated_frames.get(frame)
+            if message is None:
+                message = self._apply_decorators(f"{frame} {self._message}")
+                decorated_frames[frame] = message
+
             self._stream.execute(f"\r{message}")
             time.sleep(self._delay)
 
@@ -129,7 +138,14 @@ class SpinnerRenderer(BaseRenderer):
         """Start the spinner animation.
 
         Starts the thread that will handle the animatoin of the screen.
+
+        Note:
+            Nothing is started if the stream is not a terminal (output piped
+            to a file or another program), as nobody would see the animation.
         """
+        if not self._stream.isatty():
+            return
+
         self._done.clear()
         self._spinner_thread = threading.Thread(target=self._animation)
         self._spinner_thread.start()
@@ -24,13 +24,30 @@ class TextRenderer(BaseRenderer):
         """
         super().__init__(stream or StdoutStream())
 
+    def format(self, text: str) -> str:
+        """Apply the decorators to every line of the text without writing it.
+
+        Note:
+            Lines that decorate to nothing are dropped, as the stream would
+            skip them anyway.
+
+        Args:
+            text (str): The textual value that will be decorated.
+
+        Returns:
+            str: The decorated lines joined by newlines.
+        """
+        decorated_lines = (self._apply_decorators(line) for line in text.splitlines())
+        return "\n".join(line for line in decorated_lines if line)
+
     def render(self, text: str) -> None:
         """The main function to render thext.
 
+        Note:
+            All lines are decorated first and handed to the stream as a single
+            block, so a long text costs one write/flush instead of one per line.
+
         Args:
             text (str): The textual value that will be represented in the terminal.
         """
-        lines = text.splitlines()
-        for line in lines:
-            decorated_text = self._apply_decorators(line)
-            self._stream.execute(decorated_text)
+        self._stream.execute(self.format(text))
@@ -3,13 +3,13 @@ Utilitary module to interact with the CLI. This olds the basic implementation
 that is reused across commands and other interactions.
 """
 
-import dataclasses
 import getpass
 import os
 import select
 import sys
 from abc import ABC, abstractmethod
 from argparse import SUPPRESS, ArgumentParser, _SubParsersAction
+from functools import cached_property
 from typing import Optional
 
 from command_line_assistant.constants import VERSION
@@ -17,11 +17,18 @@ from command_line_assistant.constants import VERSION
 # Define the type here so pyright is happy with it.
 SubParsersAction = _SubParsersAction
 
-PARENT_ARGS: list[str] = ["--version", "-v", "-h", "--help"]
-ARGS_WITH_VALUES: list[str] = ["--clear"]
+#: Subcommands available to the CLI mapped to the module that implements them.
+#: The module is only imported when its subcommand needs to be registered.
+SUBCOMMANDS: dict[str, str] = {
+    "query": "command_line_assistant.commands.query",
+    "history": "command_line_assistant.commands.history",
+}
+PARENT_ARGS: frozenset[str] = frozenset(("--version", "-v", "-h", "--help"))
+ARGS_WITH_VALUES: frozenset[str] = frozenset(("--clear",))
+#: Arguments that end the scan for a subcommand, resolved with a single lookup.
+FAST_EXIT_ARGS: frozenset[str] = frozenset(SUBCOMMANDS) | PARENT_ARGS
 
 
-@dataclasses.dataclass
 class CommandContext:
     """A context for all commands with useful information.
 
@@ -33,8 +40,23 @@ class CommandContext:
         effective_user_id (int): The effective user id.
     """
 
-    username: str = getpass.getuser()
-    effective_user_id: int = os.getegid()
+    __slots__ = ("username", "effective_user_id")
+
+    def __init__(
+        self, username: Optional[str] = None, effective_user_id: Optional[int] = None
+    ) -> None:
+        """Constructor of the class.
+
+        Args:
+            username (Optional[str], optional): The username of the current
+            user. Defaults to the user running the process.
+            effective_user_id (Optional[int], optional): The effective user id.
+            Defaults to the one from the running process.
+        """
+        self.username: str = username or getpass.getuser()
+        self.effective_user_id: int = (
+            os.geteuid() if effective_user_id is None else effective_user_id
+        )
 
 
 class BaseCLICommand(ABC):
@@ -42,10 +64,21 @@ class BaseCLICommand(ABC):
 
     def __init__(self) -> None:
         """Constructor for the base class."""
-        self._context: CommandContext = CommandContext()
-
         super().__init__()
 
+    @cached_property
+    def _context(self) -> CommandContext:
+        """Lazily create the context of the user running the command.
+
+        Note:
+            The context is only needed right before talking to the daemon, so
+            invocations that fail validation never look up the user.
+
+        Returns:
+            CommandContext: The context for this command.
+        """
+        return CommandContext()
+
     @abstractmethod
     def run(self) -> int:
         """Entrypoint method for all CLI commands."""
@@ -64,28 +97,37 @@ def add_default_command(stdin: Optional[str], argv: list[str]):
     if not args and not stdin:
         return args
 
-    subcommand = _subcommand_used(argv)
-    if subcommand is None:
-        args.insert(0, "query")
+    # The program name is not part of the scan, only the user arguments.
+    if subcommand_used(args) is None:
+        return ["query", *args]
 
     return args
 
 
-def _subcommand_used(args: list[str]):
-    """Return what subcommand has been used by the user. Return None if no subcommand has been used."""
-    for index, argument in enumerate(args):
-        # If we have a exact match for any of the commands, return directly
-        if argument in ("query", "history"):
-            return argument
+def subcommand_used(args: list[str]) -> Optional[str]:
+    """Return what subcommand has been used by the user.
 
-        # It means that we hit a --version/--help
-        if argument in PARENT_ARGS:
-            return argument
+    Args:
+        args (list[str]): List of arguments from CLI, without the program name
 
-        # Otherwise, check if this is the second part of an arg that takes a value.
-        elif args[index - 1] in ARGS_WITH_VALUES:
+    Returns:
+        Optional[str]: The subcommand (or `--help`/`--version`) used, or None
+        if no subcommand has been used.
+    """
+    previous = None
+    for argument in args:
+        # Skip the second part of an arg that takes a value.
+        if previous in ARGS_WITH_VALUES:
+            previous = argument
             continue
 
+        # If we have a exact match for any of the commands or we hit a
+        # --version/--help, return directly
+        if argument in FAST_EXIT_ARGS:
+            return argument
+
+        previous = argument
+
     return None
 
 
@@ -8,6 +8,9 @@ BINARY_SIGNATURES = [
     b"%PDF",  # PDF files
     b"PK\x03\x04",  # ZIP files
 ]
+#: The same signatures as text. They are plain ASCII, so they can be matched
+#: against the decoded content without encoding it back to bytes.
+TEXT_SIGNATURES = tuple(signature.decode("utf-8") for signature in BINARY_SIGNATURES)
 
 
 def is_content_in_binary_format(content: Union[str, bytes]) -> bool:
@@ -32,8 +35,7 @@ def is_content_in_binary_format(content: Union[str, bytes]) -> bool:
             return True
 
         # Additional check for common binary file signatures
-        content_bytes = content.encode("utf-8") if isinstance(content, str) else content
-        if any(content_bytes.startswith(sig) for sig in BINARY_SIGNATURES):
+        if content.startswith(TEXT_SIGNATURES):
             return True
     except UnicodeDecodeError as e:
         raise ValueError(
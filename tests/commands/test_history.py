@@ -1,9 +1,11 @@
+from argparse import ArgumentParser
 from unittest.mock import patch
 
 import pytest
 
 from command_line_assistant.commands.history import (
     HistoryCommand,
+    register_subcommand,
 )
 from command_line_assistant.dbus.structures import HistoryEntry, HistoryItem
 
@@ -70,7 +72,7 @@ def test_retrieve_conversation_filtered_success(
         sample_history_entry
     )
 
-    HistoryCommand(clear=False, first=False, last=False, filter="missing").run()
+    HistoryCommand(clear=False, first=False, last=False, filter_keyword="missing").run()
     captured = capsys.readouterr()
     mock_proxy.GetFilteredConversation.assert_called_once()
     assert (
@@ -165,3 +167,55 @@ def test_show_history_no_entries(capsys):
     HistoryCommand(clear=False, first=False, last=False)._show_history([])
     captured = capsys.readouterr()
     assert "No history found." in captured.out
+
+
+def test_show_history_single_write(sample_history_entry, capsys):
+    command = HistoryCommand(clear=False, first=False, last=False)
+    with patch.object(
+        command._history_renderer, "render", wraps=command._history_renderer.render
+    ) as mock_render:
+        command._show_history(sample_history_entry.entries)
+
+    mock_render.assert_called_once()
+    captured = capsys.readouterr()
+    assert captured.out == (
+        "\x1b[92mQuery: test query\x1b[0m\n"
+        "\x1b[94mAnswer: test response\x1b[0m\n"
+        "Time: 2024-01-01T00:00:00Z\n"
+        "--------------------------\n"
+        "\x1b[92mQuery: test final query\x1b[0m\n"
+        "\x1b[94mAnswer: test final response\x1b[0m\n"
+        "Time: 2024-01-02T00:00:00Z\n"
+        "--------------------------\n"
+    )
+
+
+@pytest.mark.parametrize(("filter_keyword",), (("",), ("   ",)))
+def test_retrieve_conversation_filtered_empty_keyword(
+    mock_proxy, filter_keyword, capsys
+):
+    """Test an empty filter is rejected without calling the daemon."""
+    result = HistoryCommand(
+        clear=False, first=False, last=False, filter_keyword=filter_keyword
+    ).run()
+
+    captured = capsys.readouterr()
+    assert result == 1
+    assert "The filter keyword can't be empty." in captured.err
+    mock_proxy.GetFilteredConversation.assert_not_called()
+    mock_proxy.GetHistory.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("argv",),
+    (
+        (["history", "--first", "--last"],),
+        (["history", "--clear", "--filter", "test"],),
+    ),
+)
+def test_register_subcommand_actions_are_exclusive(argv):
+    parser = ArgumentParser()
+    register_subcommand(parser.add_subparsers())
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(argv)
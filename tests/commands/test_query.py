@@ -84,7 +84,10 @@ def test_query_command_empty_response(mock_dbus_service, capsys):
     )
 
     command = QueryCommand("test query", None)
-    command.run()
+    with patch(
+        "command_line_assistant.rendering.base.BaseStream.isatty", return_value=True
+    ):
+        command.run()
 
     captured = capsys.readouterr()
     assert "Requesting knowledge from AI" in captured.out.strip()
@@ -246,3 +249,13 @@ def test_dbus_error_handling(exception, expected, mock_dbus_service, capsys):
     # Verify error message in stdout
     captured = capsys.readouterr()
     assert expected in captured.err.strip()
+
+
+def test_get_input_source_reads_attachment_once():
+    attachment = mock.Mock()
+    attachment.read.return_value = "file query"
+    command = QueryCommand("query", None, attachment)
+
+    assert command._get_input_source() == "query file query"
+    assert command._get_input_source() == "query file query"
+    attachment.read.assert_called_once()
@@ -2,6 +2,7 @@ import uuid
 from unittest.mock import Mock, patch
 
 import pytest
+from sqlalchemy import inspect, text
 from sqlalchemy.exc import SQLAlchemyError
 
 from command_line_assistant.daemon.database.manager import (
@@ -53,6 +54,30 @@ def test_connect_success(database_manager):
         pytest.fail(f"connect() raised {e} unexpectedly!")
 
 
+def test_connect_creates_history_index(database_manager):
+    """Test that the per-user history index is created."""
+    indexes = {
+        index["name"]: index["column_names"]
+        for index in inspect(database_manager._engine).get_indexes("history")
+    }
+
+    assert indexes["ix_history_user_id_timestamp"] == ["user_id", "timestamp"]
+
+
+def test_connect_creates_history_index_on_existing_table(database_manager):
+    """Test that the index is added to a history table created without it."""
+    with database_manager._engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_history_user_id_timestamp"))
+
+    database_manager.connect()
+
+    indexes = [
+        index["name"]
+        for index in inspect(database_manager._engine).get_indexes("history")
+    ]
+    assert "ix_history_user_id_timestamp" in indexes
+
+
 def test_connect_failure(mock_config):
     """Test database connection failure."""
     manager = DatabaseManager(mock_config)
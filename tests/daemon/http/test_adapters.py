@@ -0,0 +1,15 @@
+from command_line_assistant.daemon.http.adapters import DEFAULT_RETRY, RetryAdapter
+
+
+def test_retry_adapter_shares_default_retry():
+    assert RetryAdapter().max_retries is DEFAULT_RETRY
+
+
+def test_retry_adapter_custom_max_retries():
+    adapter = RetryAdapter(max_retries=5)
+
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_factor == DEFAULT_RETRY.backoff_factor
+    assert adapter.max_retries.status_forcelist == DEFAULT_RETRY.status_forcelist
+    assert adapter.max_retries.allowed_methods == DEFAULT_RETRY.allowed_methods
+    assert DEFAULT_RETRY.total == 3
@@ -27,6 +27,26 @@ def test_handle_query():
     assert result == "test"
 
 
+@responses.activate
+def test_handle_query_sends_json_payload():
+    responses.post(
+        url="http://localhost/infer",
+        json={"data": {"text": "test"}},
+        match=[responses.matchers.json_params_matcher({"question": "test"})],
+    )
+
+    config = Config(
+        backend=BackendSchema(
+            endpoint="http://localhost", auth=AuthSchema(verify_ssl=False)
+        )
+    )
+
+    query.submit(query="test", config=config)
+
+    request = responses.calls[0].request
+    assert request.headers["Content-Type"] == "application/json"
+
+
 @responses.activate
 def test_handle_query_raising_status():
     responses.post(
@@ -4,7 +4,8 @@ import pytest
 import urllib3
 
 from command_line_assistant.constants import VERSION
-from command_line_assistant.daemon.http.session import get_session
+from command_line_assistant.daemon.http import session as session_module
+from command_line_assistant.daemon.http.session import get_pooled_session, get_session
 from command_line_assistant.dbus.exceptions import RequestFailedError
 
 
@@ -97,3 +98,24 @@ def test_session_with_missing_ssl_certificate(tmp_path, mock_config):
 
     with pytest.raises(RequestFailedError, match="Couldn't find certificate files at"):
         get_session(mock_config)
+
+
+def test_pooled_session_is_reused(mock_config, monkeypatch):
+    monkeypatch.setattr(session_module, "_pooled_session", None)
+
+    session = get_pooled_session(mock_config)
+
+    assert get_pooled_session(mock_config) is session
+
+
+def test_pooled_session_rebuilt_for_new_config(mock_config, monkeypatch):
+    monkeypatch.setattr(session_module, "_pooled_session", None)
+    other_config = MagicMock()
+    other_config.backend = mock_config.backend
+
+    session = get_pooled_session(mock_config)
+    with patch.object(session, "close") as mock_close:
+        other_session = get_pooled_session(other_config)
+
+    mock_close.assert_called_once()
+    assert other_session is not session
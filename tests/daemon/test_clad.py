@@ -13,19 +13,19 @@ def mock_config():
 
 @pytest.fixture
 def mock_setup_logging():
-    with patch("command_line_assistant.daemon.clad.setup_logging") as mock:
+    with patch("command_line_assistant.logger.setup_logging") as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_serve():
-    with patch("command_line_assistant.daemon.clad.serve") as mock:
+    with patch("command_line_assistant.dbus.server.serve") as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_load_config():
-    with patch("command_line_assistant.daemon.clad.load_config_file") as mock:
+    with patch("command_line_assistant.config.load_config_file") as mock:
         mock.return_value = Mock(spec=Config)
         yield mock
 
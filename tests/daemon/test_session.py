@@ -94,3 +94,15 @@ def test_machine_id_file_not_found(tmp_path):
         session = UserSessionManager(1000)
         with pytest.raises(FileNotFoundError, match="Machine ID file not found at .*"):
             assert session.machine_id
+
+
+def test_machine_id_read_once_per_process(tmp_path):
+    machine_id_file = tmp_path / "machine-id"
+    machine_id_file.write_text("09e28913cb074ed995a239c93b07fd8a")
+    with patch(
+        "command_line_assistant.daemon.session.MACHINE_ID_PATH", machine_id_file
+    ):
+        first = UserSessionManager(1000).machine_id
+        # Changing the file doesn't affect the already cached value.
+        machine_id_file.write_text("771640198a6344bba7ad356cf525243a")
+        assert UserSessionManager(1001).machine_id == first
@@ -108,7 +108,9 @@ def test_history_interface_get_filtered_conversation(
     ) as manager:
         manager.write("test query", "test response")
         manager.write("not a query", "not a response")
-        response = history_interface.GetFilteredConversation(1000, filter="test")
+        response = history_interface.GetFilteredConversation(
+            1000, filter_keyword="test"
+        )
 
         reconstructed = HistoryEntry.from_structure(response)
         assert len(reconstructed.entries) == 1
@@ -128,7 +130,9 @@ def test_history_interface_get_filtered_conversation_duplicate_entries_not_match
     ) as manager:
         manager.write("test query", "test response")
         manager.write("test query", "test response")
-        response = history_interface.GetFilteredConversation(1000, filter="test")
+        response = history_interface.GetFilteredConversation(
+            1000, filter_keyword="test"
+        )
 
         reconstructed = HistoryEntry.from_structure(response)
         assert len(reconstructed.entries) == 2
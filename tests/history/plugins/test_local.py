@@ -2,6 +2,7 @@ import uuid
 from unittest.mock import Mock, create_autospec, patch
 
 import pytest
+from sqlalchemy import event
 
 from command_line_assistant.daemon.database.manager import DatabaseManager
 from command_line_assistant.dbus.exceptions import (
@@ -64,6 +65,31 @@ class TestLocalHistoryRead:
         assert result[0]["response"] == "test response"
         assert "timestamp" in result[0]
 
+    def test_read_single_query(self, local_history: LocalHistory):
+        """Should load the entries and their interactions in one query."""
+        uid = uuid.uuid4()
+        for index in range(3):
+            local_history.write(uid, f"query {index}", f"response {index}")
+
+        statements = []
+
+        def count_statements(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = local_history._db._engine
+        event.listen(engine, "before_cursor_execute", count_statements)
+        try:
+            result = local_history.read(uid)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statements)
+
+        assert sorted(entry["query"] for entry in result) == [
+            "query 0",
+            "query 1",
+            "query 2",
+        ]
+        assert len(statements) == 1
+
     def test_read_failure(self, local_history: LocalHistory):
         """Should raise CorruptedHistoryError on read failure."""
         with pytest.raises(CorruptedHistoryError, match="Failed to read from database"):
@@ -49,6 +49,20 @@ def test_color_decorator_with_background_and_no_color():
         assert "Test text" in result
 
 
+def test_color_decorator_resolves_escape_sequences_once():
+    with patch.dict(os.environ, {}, clear=True):
+        decorator = ColorDecorator(foreground="white", background="blue")
+
+    assert decorator.prefix == "\x1b[44m\x1b[37m"
+    assert decorator.suffix == "\x1b[0m"
+
+    with patch.dict(os.environ, {"NO_COLOR": "1"}, clear=True):
+        decorator = ColorDecorator(foreground="white", background="blue")
+
+    assert decorator.prefix == ""
+    assert decorator.suffix == ""
+
+
 def test_color_decorator_invalid_color():
     with pytest.raises(ValueError):
         ColorDecorator(foreground="invalid")
@@ -1,4 +1,5 @@
 import shutil
+from pathlib import Path
 from typing import Iterator
 
 import pytest
@@ -244,3 +245,24 @@ class TestWriteOnceDecorator:
 
         assert result == "Test text"
         assert decorator._state_file.exists()
+
+    def test_state_file_created_concurrently(self, decorator, monkeypatch):
+        """Test nothing is written if the state file shows up after the check"""
+        decorator._state_dir.mkdir()
+        decorator._state_file.write_text("1")
+        monkeypatch.setattr(Path, "exists", lambda self: False)
+
+        assert not decorator.decorate("Text")
+
+    def test_failed_write_does_not_suppress_later_writes(self, decorator, monkeypatch):
+        """Test a failed state file creation doesn't suppress later writes"""
+
+        def raise_oserror(*args, **kwargs):
+            raise OSError("Read-only file system")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(Path, "open", raise_oserror)
+            with pytest.raises(OSError):
+                decorator.decorate("First text")
+
+        assert decorator.decorate("Second text") == "Second text"
@@ -131,3 +131,33 @@ def test_spinner_clear_message(mock_stream):
     # Verify any written message contains clear spaces
     written_text = mock_stream.written
     assert any(" " * (len("Clear me") + 2) + "\r" in text for text in written_text)
+
+
+def test_spinner_decorates_each_frame_once(mock_stream):
+    """Test that the decorators are applied once per distinct frame"""
+    spinner = SpinnerRenderer(
+        "Loading...", stream=mock_stream, frames=Frames.dash, delay=0.01
+    )
+    calls = []
+    original = spinner._apply_decorators
+
+    def _apply_decorators(text):
+        calls.append(text)
+        return original(text)
+
+    spinner._apply_decorators = _apply_decorators
+    with spinner:
+        time.sleep(0.2)
+
+    assert len(calls) == len(set(calls)) <= 4
+
+
+def test_spinner_not_started_without_terminal(mock_stream):
+    """Test the spinner does nothing if the stream is not a terminal"""
+    mock_stream._stream.isatty.return_value = False
+    spinner = SpinnerRenderer("Loading...", stream=mock_stream)
+
+    with spinner:
+        assert spinner._spinner_thread is None
+
+    assert not mock_stream.written
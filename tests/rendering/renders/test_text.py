@@ -1,7 +1,10 @@
+from unittest.mock import patch
+
 from command_line_assistant.rendering.decorators.colors import ColorDecorator
 from command_line_assistant.rendering.decorators.style import StyleDecorator
 from command_line_assistant.rendering.decorators.text import TextWrapDecorator
 from command_line_assistant.rendering.renders.text import TextRenderer
+from command_line_assistant.rendering.stream import StdoutStream
 
 
 def test_text_renderer_multiple_decorators():
@@ -82,3 +85,23 @@ def test_text_renderer_render_multiline(capsys):
 
     captured = capsys.readouterr()
     assert len(captured.out.strip().split("\n")) == 3
+
+
+def test_text_renderer_render_multiline_single_write():
+    stream = StdoutStream()
+    renderer = TextRenderer(stream=stream)
+
+    with patch.object(stream, "execute") as mock_execute:
+        renderer.render("Line 1\nLine 2\nLine 3")
+
+    mock_execute.assert_called_once_with("Line 1\nLine 2\nLine 3")
+
+
+def test_text_renderer_format_does_not_write(capsys):
+    renderer = TextRenderer()
+    renderer.update([ColorDecorator(foreground="red")])
+
+    assert renderer.format("Line 1\n\nLine 2") == (
+        "\x1b[31mLine 1\x1b[0m\n\x1b[31m\x1b[0m\n\x1b[31mLine 2\x1b[0m"
+    )
+    assert capsys.readouterr().out == ""
@@ -31,11 +31,34 @@ def test_handle_caret(tmp_path):
     assert "Context data: cmd from file\nQuestion: test" == result
 
 
-def test_handle_script_session(tmp_path, monkeypatch):
+def test_handle_script_session(tmp_path, monkeypatch, caplog):
     output_file = tmp_path / "output.tmp"
     output_file.write_text("hi!")
     monkeypatch.setattr(os, "system", mock.Mock())
 
-    handlers.handle_script_session(output_file)
+    with caplog.at_level("INFO"):
+        handlers.handle_script_session(output_file)
 
     assert not output_file.exists()
+    assert f"Removed {output_file}" in caplog.text
+
+
+def test_handle_caret_last_command_only(tmp_path):
+    output_file = tmp_path / "output_file.tmp"
+    output_file.write_text("$ first cmd\nfirst output\n$ last cmd\nlast output\n")
+    result = handlers.handle_caret(
+        query="^test", config=Config(output=OutputSchema(file=output_file))
+    )
+
+    assert "Context data: last cmd\nlast output\nQuestion: test" == result
+
+
+def test_handle_script_session_missing_file(tmp_path, monkeypatch, caplog):
+    output_file = tmp_path / "output.tmp"
+    monkeypatch.setattr(os, "system", mock.Mock())
+
+    with caplog.at_level("INFO"):
+        handlers.handle_script_session(output_file)
+
+    assert not output_file.exists()
+    assert "Removed" not in caplog.text
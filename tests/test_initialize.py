@@ -2,7 +2,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from command_line_assistant.initialize import initialize
+from command_line_assistant.initialize import (
+    initialize,
+    register_subcommands,
+)
 from command_line_assistant.utils.cli import BaseCLICommand
 
 
@@ -138,3 +141,35 @@ def test_initialize_command_selection(argv, expected_command):
 
         assert result == 1
         mock_command.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("subcommand", "registered"),
+    (
+        (None, ["query", "history"]),
+        ("query", ["query"]),
+        ("history", ["history"]),
+    ),
+)
+def test_register_subcommands_only_selected(subcommand, registered):
+    """Only the selected subcommand is registered, or all when none is."""
+    with (
+        patch("command_line_assistant.commands.query.register_subcommand") as query,
+        patch("command_line_assistant.commands.history.register_subcommand") as history,
+    ):
+        register_subcommands(subcommand)
+
+    assert query.called == ("query" in registered)
+    assert history.called == ("history" in registered)
+
+
+def test_register_subcommands_full_without_selection():
+    """All subcommands are registered with their arguments when none is selected."""
+    parser = register_subcommands()
+    subparsers = next(action for action in parser._actions if action.dest == "command")
+
+    assert list(subparsers.choices) == ["query", "history"]
+    query_dests = {action.dest for action in subparsers.choices["query"]._actions}
+    history_dests = {action.dest for action in subparsers.choices["history"]._actions}
+    assert {"query_string", "attachment"} <= query_dests
+    assert {"clear", "first", "last", "filter_keyword"} <= history_dests
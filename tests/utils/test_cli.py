@@ -55,6 +55,9 @@ def test_create_argument_parser():
         ),
         (["/usr/bin/c", "test query"], None, ["query", "test query"]),
         (["/usr/bin/c", "history"], None, ["history"]),
+        (["c", "history", "--first"], None, ["history", "--first"]),
+        (["c", "--help"], None, ["--help"]),
+        (["c", "--version"], "query from stdin", ["--version"]),
     ],
 )
 def test_add_default_command(args, stdin, expected):
@@ -69,7 +72,43 @@ def test_add_default_command(args, stdin, expected):
         (["--version"], "--version"),
         (["--help"], "--help"),
         (["--clear"], None),
+        (["c", "history", "--clear"], "history"),
+        # The value that follows an argument is never a subcommand
+        (["--clear", "query"], None),
     ),
 )
 def test_subcommand_used(argv, expected):
-    assert cli._subcommand_used(argv) == expected
+    assert cli.subcommand_used(argv) == expected
+
+
+def test_command_context_defaults(monkeypatch):
+    monkeypatch.setattr(cli.getpass, "getuser", lambda: "test")
+    monkeypatch.setattr(cli.os, "geteuid", lambda: 1000)
+
+    context = cli.CommandContext()
+
+    assert context.username == "test"
+    assert context.effective_user_id == 1000
+    assert not hasattr(context, "__dict__")
+
+
+def test_command_context_explicit_values():
+    context = cli.CommandContext(username="other", effective_user_id=0)
+
+    assert context.username == "other"
+    assert context.effective_user_id == 0
+
+
+def test_base_cli_command_context_is_lazy(monkeypatch):
+    class DummyCommand(cli.BaseCLICommand):
+        def run(self) -> int:
+            return 0
+
+    calls = []
+    monkeypatch.setattr(cli.getpass, "getuser", lambda: calls.append(1) or "test")
+
+    command = DummyCommand()
+    assert not calls
+
+    assert command._context is command._context
+    assert calls == [1]
@@ -22,3 +22,15 @@ def test_is_content_in_binary_format_decode_error():
         ValueError, match="File appears to be binary or contains invalid text encoding"
     ):
         is_content_in_binary_format(b"\x80")
+
+
+@pytest.mark.parametrize(
+    ("content",),
+    (
+        ("\x7fELF test elf file",),
+        ("%PDF test pdf file",),
+        ("PK\x03\x04 test zip",),
+    ),
+)
+def test_is_content_in_binary_format_text_signatures(content):
+    assert is_content_in_binary_format(content)
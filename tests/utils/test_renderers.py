@@ -15,7 +15,13 @@ def test_create_error_renderer(capsys: pytest.CaptureFixture[str]):
 
 
 def test_create_spinner_renderer(capsys, mock_stream):
-    with patch("command_line_assistant.rendering.stream.StdoutStream", mock_stream):
+    with (
+        patch("command_line_assistant.rendering.stream.StdoutStream", mock_stream),
+        patch(
+            "command_line_assistant.rendering.base.BaseStream.isatty",
+            return_value=True,
+        ),
+    ):
         spinner = renderers.create_spinner_renderer(message="Loading...", decorators=[])
         spinner.start()
         assert isinstance(spinner._spinner_thread, threading.Thread)